@@ -9,43 +9,272 @@ with detailed cost calculations and professional reporting.
 import boto3
 import json
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from botocore.exceptions import ClientError
+from functools import cached_property, lru_cache
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 import argparse
+import asyncio
+import csv
+import hashlib
+import io
+import logging
 import sys
-from typing import List, Dict, Any
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Sequence
 import colorama
 from colorama import Fore, Style, init
 from tqdm import tqdm
 
+try:
+    import aioboto3
+except ImportError:  # Optional: only needed for discover_all_async
+    aioboto3 = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON report serialization
+    orjson = None
+
 # Initialize colorama
 init(autoreset=True)
 
 VERSION = "v1.0.0"
 
+# Services the tool can scan, in report order
+ALL_SERVICES = ('ec2', 'ebs', 's3', 'eip', 'snapshots')
+VALID_SERVICES = frozenset(ALL_SERVICES)
+
+# Hours in an average month, used to turn hourly rates into monthly costs
+HOURS_PER_MONTH = 730
+
+BYTES_PER_GB = 1 << 30
+
+# Server-side filters used to skip terminated, deleted or incomplete resources
+SKIP_TERMINATED_FILTERS = {
+    'ec2': [{'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']}],
+    'ebs': [{'Name': 'status', 'Values': ['creating', 'available', 'in-use', 'deleting', 'error']}],
+    'snapshots': [{'Name': 'status', 'Values': ['completed']}],
+}
+
+# Concurrency and overall time budget for Pricing API queries
+MAX_PRICING_WORKERS = 8
+PRICING_TIMEOUT = 15
+
+# Pricing API results shared by every scan in the process, keyed by (service, region).
+# Public prices do not depend on the account, and they change far less often than this TTL.
+PRICING_CACHE_TTL = 900
+_RATES_CACHE: Dict[tuple, tuple] = {}
+
+# Pricing API filters selecting on-demand, shared-tenancy Linux instance prices
+EC2_PRICING_FILTERS = [
+    {'Type': 'TERM_MATCH', 'Field': 'operatingSystem', 'Value': 'Linux'},
+    {'Type': 'TERM_MATCH', 'Field': 'tenancy', 'Value': 'Shared'},
+    {'Type': 'TERM_MATCH', 'Field': 'preInstalledSw', 'Value': 'NA'},
+    {'Type': 'TERM_MATCH', 'Field': 'capacitystatus', 'Value': 'Used'},
+    {'Type': 'TERM_MATCH', 'Field': 'licenseModel', 'Value': 'No License required'},
+]
+
+# Recommendations line used when no idle resources were found
+NO_RECOMMENDATIONS = "[SUCCESS] No obviously unused resources found"
+
+# Row layouts for the detail tables of the text report
+EC2_ROW_FORMAT = "{InstanceId:<20} {InstanceType:<15} {State:<12} {Region:<15} ${MonthlyCost:<14.2f} {Name:<20}\n"
+EBS_ROW_FORMAT = "{VolumeId:<20} {VolumeType:<10} {Size:<12} {State:<12} {Region:<15} ${MonthlyCost:<14.2f} {Name:<20}\n"
+S3_ROW_FORMAT = "{Name:<30} {Region:<15} {SizeGB:<15.2f} ${MonthlyCost:<14.2f}\n"
+EIP_ROW_FORMAT = "{PublicIp:<15} {Region:<15} {Associated:<12} ${MonthlyCost:<14.2f}\n"
+SNAPSHOT_ROW_FORMAT = ("{SnapshotId:<25} {VolumeId:<20} {State:<12} {VolumeSize:<12} {Region:<15} "
+                       "${MonthlyCost:<14.2f} {Name:<20}\n")
+
+# On-disk cache for slowly changing AWS metadata
+CACHE_DIR = Path.home() / '.cache' / 'cloud_archaeologist'
+REGIONS_CACHE_TTL = 7 * 24 * 3600  # Regions change rarely, refresh weekly
+
+# Maximum number of regions scanned concurrently by each discover_* method
+MAX_REGION_WORKERS = 16
+
+# Size of the shared (service, region) task pool used by a full scan, and the
+# most tasks any one service may run at once so a single API is not throttled
+MAX_SCAN_WORKERS = 32
+MAX_SERVICE_WORKERS = 8
+
+# Result attribute and report label for each service discovered per region
+REGIONAL_SERVICES = {
+    'ec2': ('ec2_instances', 'EC2 instances'),
+    'ebs': ('ebs_volumes', 'EBS volumes'),
+    'eip': ('eips', 'Elastic IPs'),
+    'snapshots': ('snapshots', 'snapshots'),
+}
+
+# Largest page each describe call accepts, so large accounts need fewer round-trips
+PAGE_SIZES = {'describe_instances': 1000, 'describe_volumes': 500, 'describe_snapshots': 1000}
+
+# Maximum number of Availability Zones paginated concurrently within a region
+MAX_AZ_WORKERS = 5
+
+# Maximum number of S3 buckets sized concurrently
+MAX_BUCKET_WORKERS = 32
+
+
+# All console output goes through this logger; quiet mode raises its level
+logger = logging.getLogger("archaeologist")
+
+
+class _ColorFormatter(logging.Formatter):
+    """Format records with the ANSI color passed in their 'color' extra."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return getattr(record, 'color', '') + super().format(record)
+
+
+def _on_demand_price(product: Dict[str, Any]) -> Optional[float]:
+    """Return the USD on-demand unit price of a Pricing API product, if it has one."""
+    for offer in product.get('terms', {}).get('OnDemand', {}).values():
+        for dimension in offer['priceDimensions'].values():
+            price = float(dimension['pricePerUnit'].get('USD', 0))
+            if price > 0:
+                return price
+    return None
+
+
+def _tags_to_dict(tags) -> Dict[str, str]:
+    """Convert an AWS tag list into a key -> value dictionary."""
+    return {tag['Key']: tag['Value'] for tag in tags or ()}
+
+
+def _build_ec2_row(instance: Dict[str, Any], region: str, ec2_costs: Dict[str, float], now: datetime) -> Dict[str, Any]:
+    """Build the record for a single EC2 instance."""
+    # Calculate running hours based on launch time
+    launch_time = instance.get('LaunchTime')
+    if launch_time:
+        running_hours = (now - launch_time).total_seconds() / 3600
+    else:
+        running_hours = 0
+
+    # Get instance cost
+    instance_type = instance.get('InstanceType', 'unknown')
+    hourly_cost = ec2_costs.get(instance_type, 0.05)  # Default cost if unknown type
+    monthly_cost = hourly_cost * HOURS_PER_MONTH
+
+    # Get instance tags
+    name_tag = _tags_to_dict(instance.get('Tags')).get('Name', 'N/A')
+
+    return {
+        'InstanceId': instance.get('InstanceId'),
+        'InstanceType': instance_type,
+        'State': instance['State']['Name'],
+        'Region': region,
+        'PublicIP': instance.get('PublicIpAddress', 'N/A'),
+        'PrivateIP': instance.get('PrivateIpAddress', 'N/A'),
+        'LaunchTime': launch_time.isoformat() if launch_time else 'N/A',
+        'RunningHours': round(running_hours, 2),
+        'HourlyCost': hourly_cost,
+        'MonthlyCost': round(monthly_cost, 4),
+        'Name': name_tag,
+        'VpcId': instance.get('VpcId', 'N/A'),
+        'SubnetId': instance.get('SubnetId', 'N/A'),
+    }
+
+
+def _build_ebs_row(volume: Dict[str, Any], region: str, ebs_costs: Dict[str, float]) -> Dict[str, Any]:
+    """Build the record for a single EBS volume."""
+    # Get volume cost
+    volume_type = volume.get('VolumeType', 'gp2')
+    size_gb = volume.get('Size', 0)
+    monthly_cost = ebs_costs.get(volume_type, 0.10) * size_gb
+
+    # Get volume tags
+    name_tag = _tags_to_dict(volume.get('Tags')).get('Name', 'N/A')
+
+    return {
+        'VolumeId': volume.get('VolumeId'),
+        'VolumeType': volume_type,
+        'Size': size_gb,
+        'State': volume.get('State'),
+        'Region': region,
+        'CreateTime': volume.get('CreateTime').isoformat(),
+        'MonthlyCost': round(monthly_cost, 4),
+        'Name': name_tag,
+        'Encrypted': volume.get('Encrypted', False),
+        'Iops': volume.get('Iops', 'N/A'),
+        'Throughput': volume.get('Throughput', 'N/A'),
+    }
+
+
+def _build_eip_row(address: Dict[str, Any], region: str, unattached_rate: float) -> Dict[str, Any]:
+    """Build the record for a single Elastic IP address."""
+    # Calculate monthly cost based on whether EIP is associated
+    is_associated = address.get('InstanceId') or address.get('NetworkInterfaceId') or address.get('AssociationId')
+    hourly_rate = 0 if is_associated else unattached_rate
+    monthly_cost = hourly_rate * HOURS_PER_MONTH
+
+    return {
+        'PublicIp': address.get('PublicIp'),
+        'AllocationId': address.get('AllocationId'),
+        'Domain': address.get('Domain'),
+        'Region': region,
+        'InstanceId': address.get('InstanceId', 'N/A'),
+        'NetworkInterfaceId': address.get('NetworkInterfaceId', 'N/A'),
+        'IsAssociated': is_associated,
+        'HourlyCost': hourly_rate,
+        'MonthlyCost': round(monthly_cost, 4),
+    }
+
+
+def _build_snapshot_row(snapshot: Dict[str, Any], region: str, per_gb_month: float) -> Dict[str, Any]:
+    """Build the record for a single EBS snapshot."""
+    # Get snapshot size and calculate cost
+    volume_size = snapshot.get('VolumeSize', 0)  # in GB
+    # Calculate cost based on size (simplified)
+    monthly_cost = volume_size * per_gb_month
+
+    # Get snapshot tags
+    name_tag = _tags_to_dict(snapshot.get('Tags')).get('Name', 'N/A')
+
+    return {
+        'SnapshotId': snapshot.get('SnapshotId'),
+        'VolumeId': snapshot.get('VolumeId', 'N/A'),
+        'State': snapshot.get('State'),
+        'StartTime': snapshot.get('StartTime').isoformat(),
+        'VolumeSize': volume_size,
+        'Region': region,
+        'Description': snapshot.get('Description', 'N/A'),
+        'Name': name_tag,
+        'MonthlyCost': round(monthly_cost, 4),
+    }
+
 
 class CloudResourceArchaeologist:
     """
     Cloud Resource Archaeologist - A comprehensive AWS resource discovery and cost analysis tool.
     """
 
-    def __init__(self, quiet=False, regions_to_scan=None):
+    def __init__(self, quiet=False, regions_to_scan=None, live_pricing=False, skip_terminated=False, profile_name=None,
+                 cache_ttl=0, refresh_cache=False):
         """Initialize the Cloud Resource Archaeologist with AWS clients."""
         self.quiet = quiet
         self.regions_to_scan = regions_to_scan  # List of regions to scan, or None for all
-
-        # Suppress output if quiet mode is enabled
-        if quiet:
-            self.print_cyan = lambda x: None
-            self.print_green = lambda x: None
-            self.print_red = lambda x: None
-            self.print_yellow = lambda x: None
-        else:
-            self.print_cyan = lambda x: print(Fore.CYAN + x)
-            self.print_green = lambda x: print(Fore.GREEN + x)
-            self.print_red = lambda x: print(Fore.RED + x)
-            self.print_yellow = lambda x: print(Fore.YELLOW + x)
+        self.skip_terminated = skip_terminated  # Filter out terminated/deleted resources server-side
+        self.profile_name = profile_name  # AWS profile to use, or None for the default credential chain
+        self.cache_ttl = cache_ttl  # Seconds to reuse cached per-region results, 0 disables the cache
+        self.refresh_cache = refresh_cache  # Ignore cached results, but still store fresh ones
+
+        # Log to stdout unless the application has set up its own handler. The level is
+        # only set along with that handler, so later instances and applications keep theirs.
+        if not logger.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(_ColorFormatter('%(message)s'))
+            logger.addHandler(handler)
+            logger.propagate = False
+            # Suppress output if quiet mode is enabled
+            logger.setLevel(logging.CRITICAL + 1 if quiet else logging.INFO)
 
         # AWS credentials are loaded from:
         # 1. Environment variables (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_DEFAULT_REGION)
@@ -59,12 +288,28 @@ class CloudResourceArchaeologist:
         #
         # Or use: aws configure
 
-        # Create clients for various AWS services
-        self.ec2_client = boto3.client('ec2')
-        self.s3_client = boto3.client('s3')
-        self.ec2_resource = boto3.resource('ec2')
-        self.ce_client = boto3.client('ce')  # Cost Explorer
-        self.cloudwatch_client = boto3.client('cloudwatch')
+        # With static keys in the environment there is no need to fall back to the instance
+        # metadata service, whose probe stalls for a second or more on hosts outside EC2.
+        # An explicit profile makes botocore ignore those keys, and it may source its
+        # credentials from instance metadata, so leave the probe enabled then.
+        # Note this sets the variable for the whole process, not just this instance.
+        if profile_name is None and os.environ.get('AWS_ACCESS_KEY_ID') and os.environ.get('AWS_SECRET_ACCESS_KEY'):
+            os.environ.setdefault('AWS_EC2_METADATA_DISABLED', 'true')
+
+        # One session for every client, so endpoint and service models are loaded once
+        self._session = boto3.session.Session(profile_name=profile_name)
+
+        # Shared client configuration: a connection pool sized for the region/AZ
+        # fan-out, TCP keep-alive, and adaptive retries to back off when throttled
+        self._cfg = Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+        )
+
+        # Per-(service, region) clients, reused across discovery methods so connections stay warm
+        self._clients = {}
+        self._client_lock = threading.Lock()
 
         # Resource storage
         self.ec2_instances = []
@@ -73,6 +318,9 @@ class CloudResourceArchaeologist:
         self.eips = []
         self.snapshots = []
 
+        # (service, region) scans that just failed, so their empty results are not cached
+        self._failed_scans = set()
+
         # Cost constants (these would normally come from AWS pricing APIs)
         self.cost_constants = {
             'ec2': {
@@ -109,350 +357,676 @@ class CloudResourceArchaeologist:
             }
         }
 
-    def discover_ec2_instances(self) -> List[Dict[str, Any]]:
-        """Discover all EC2 instances across all regions."""
-        if not self.quiet:
-            self.print_cyan("[EC2] Discovering EC2 instances...")
+        # Region-specific rates from the AWS Pricing API, layered over cost_constants
+        self.pricing = {}
+        if live_pricing:
+            self.load_pricing()
+
+    @staticmethod
+    def print_cyan(message: str) -> None:
+        """Log a progress message."""
+        logger.info(message, extra={'color': Fore.CYAN})
+
+    @staticmethod
+    def print_green(message: str) -> None:
+        """Log a success message."""
+        logger.info(message, extra={'color': Fore.GREEN})
+
+    @staticmethod
+    def print_yellow(message: str) -> None:
+        """Log a recommendation or other warning."""
+        logger.warning(message, extra={'color': Fore.YELLOW})
+
+    @staticmethod
+    def print_red(message: str) -> None:
+        """Log an error."""
+        logger.error(message, extra={'color': Fore.RED})
+
+    def _fetch_rates(self, service: str, region: str, cancelled: Optional[threading.Event] = None) -> Dict[str, float]:
+        """Query the Pricing API for one cost table ('ec2', 'ebs' or 'snapshot') in one region.
+
+        Results are reused for PRICING_CACHE_TTL seconds. Paging stops early once cancelled is set.
+        """
+        cached = _RATES_CACHE.get((service, region))
+        if cached and time.monotonic() - cached[0] < PRICING_CACHE_TTL:
+            return cached[1]
+
+        filters = [{'Type': 'TERM_MATCH', 'Field': 'regionCode', 'Value': region}]
+        if service == 'ec2':
+            filters += EC2_PRICING_FILTERS
+        else:
+            product_family = 'Storage' if service == 'ebs' else 'Storage Snapshot'
+            filters.append({'Type': 'TERM_MATCH', 'Field': 'productFamily', 'Value': product_family})
+
+        rates = {}
+
+        # The Pricing API is only served from us-east-1
+        paginator = self._client('pricing', 'us-east-1').get_paginator('get_products')
+        for page in paginator.paginate(ServiceCode='AmazonEC2', Filters=filters):
+            for price_item in page['PriceList']:
+                product = json.loads(price_item)
+                price = _on_demand_price(product)
+                if price is None:
+                    continue
+
+                attributes = product['product']['attributes']
+                if service == 'ec2':
+                    rates[attributes['instanceType']] = price
+                elif service == 'ebs':
+                    if 'volumeApiName' in attributes:
+                        rates[attributes['volumeApiName']] = price
+                elif attributes.get('usagetype', '').endswith('EBS:SnapshotUsage'):
+                    rates['per_gb_month'] = price
 
-        ec2_instances = []
+            # Do not request further pages once load_pricing has given up; partial rates are not cached
+            if cancelled is not None and cancelled.is_set():
+                return rates
+
+        _RATES_CACHE[(service, region)] = (time.monotonic(), rates)
+        return rates
+
+    def load_pricing(self) -> None:
+        """Load region-specific EC2, EBS and snapshot rates from the AWS Pricing API.
+
+        Rates that cannot be fetched within PRICING_TIMEOUT seconds keep their cost_constants value.
+        """
+        self.print_cyan("[PRICING] Loading regional rates from the AWS Pricing API...")
 
         try:
-            # Get all regions or use provided list
-            if self.regions_to_scan:
-                regions = self.regions_to_scan
-            else:
-                # Get all regions
-                regions_response = self.ec2_client.describe_regions()
-                regions = [region['RegionName'] for region in regions_response['Regions']]
-
-            # Use tqdm for region scanning progress
-            for region in tqdm(regions, desc="Scanning regions for EC2", disable=self.quiet, colour='cyan'):
-                if not self.quiet:
-                    self.print_cyan(f"  [REGION] Scanning region: {region}")
-
-                ec2 = boto3.client('ec2', region_name=region)
-
-                try:
-                    # Describe all instances in the region
-                    paginator = ec2.get_paginator('describe_instances')
-                    page_iterator = paginator.paginate()
-
-                    for page in page_iterator:
-                        for reservation in page['Reservations']:
-                            for instance in reservation['Instances']:
-                                # Calculate running hours based on launch time
-                                launch_time = instance.get('LaunchTime')
-                                if launch_time:
-                                    running_hours = (datetime.now(launch_time.tzinfo) - launch_time).total_seconds() / 3600
-                                else:
-                                    running_hours = 0
-
-                                # Get instance cost
-                                instance_type = instance.get('InstanceType', 'unknown')
-                                hourly_cost = self.cost_constants['ec2'].get(instance_type, 0.05)  # Default cost if unknown type
-                                monthly_cost = hourly_cost * 730  # 730 hours in a month
-
-                                # Get instance tags
-                                tags = instance.get('Tags', [])
-                                name_tag = next((tag['Value'] for tag in tags if tag['Key'] == 'Name'), 'N/A')
-
-                                ec2_instance = {
-                                    'InstanceId': instance.get('InstanceId'),
-                                    'InstanceType': instance_type,
-                                    'State': instance['State']['Name'],
-                                    'Region': region,
-                                    'PublicIP': instance.get('PublicIpAddress', 'N/A'),
-                                    'PrivateIP': instance.get('PrivateIpAddress', 'N/A'),
-                                    'LaunchTime': launch_time.isoformat() if launch_time else 'N/A',
-                                    'RunningHours': round(running_hours, 2),
-                                    'HourlyCost': hourly_cost,
-                                    'MonthlyCost': round(monthly_cost, 4),
-                                    'Name': name_tag,
-                                    'VpcId': instance.get('VpcId', 'N/A'),
-                                    'SubnetId': instance.get('SubnetId', 'N/A'),
-                                }
-
-                                ec2_instances.append(ec2_instance)
-
-                except ClientError as e:
-                    self.print_red(f"    [WARNING] Error accessing region {region}: {str(e)}")
-                    continue
+            regions = self._get_regions()
+        except (BotoCoreError, ClientError) as e:
+            self.print_red(f"[WARNING] Could not load pricing, using built-in rates: {str(e)}")
+            return
+
+        # Queries still running at the deadline stop paging, so the budget also bounds
+        # API calls and how long their threads keep the process alive
+        cancelled = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=MAX_PRICING_WORKERS)
+        futures = {executor.submit(self._fetch_rates, service, region, cancelled): (region, service)
+                   for region in regions for service in ('ec2', 'ebs', 'snapshot')}
+        done, not_done = wait(futures, timeout=PRICING_TIMEOUT)
+        cancelled.set()
+        for future in not_done:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+        failed = len(not_done)
+        for future in done:
+            region, service = futures[future]
+            try:
+                self.pricing.setdefault(region, {})[service] = future.result()
+            except (BotoCoreError, ClientError):
+                failed += 1
+
+        if failed:
+            self.print_red(f"[WARNING] {failed} pricing queries failed or timed out, using built-in rates for those")
+        self.print_green(f"[SUCCESS] Loaded pricing for {len(self.pricing)} regions")
+
+    def _rates(self, service: str, region: str) -> Dict[str, float]:
+        """Return the cost table for a service in a region, preferring live Pricing API rates."""
+        regional = self.pricing.get(region, {}).get(service)
+        if not regional:
+            return self.cost_constants[service]
+        return {**self.cost_constants[service], **regional}
+
+    def _client(self, service: str, region: str):
+        """Return the cached client for a service in a region, creating it on first use."""
+        # Client creation from the shared session is not thread-safe
+        with self._client_lock:
+            key = (service, region)
+            if key not in self._clients:
+                self._clients[key] = self._session.client(service, region_name=region, config=self._cfg)
+            return self._clients[key]
+
+    def _ec2(self, region: str):
+        """Return the cached EC2 client for a region."""
+        return self._client('ec2', region)
+
+    # Clients for the default region are created on first use, so a narrow scan
+    # only pays the start-up cost of the services it actually touches
+    @cached_property
+    def ec2_client(self):
+        """EC2 client for the session's default region."""
+        return self._client('ec2', self._session.region_name)
+
+    @cached_property
+    def s3_client(self):
+        """S3 client for the session's default region."""
+        return self._client('s3', self._session.region_name)
+
+    @cached_property
+    def ec2_resource(self):
+        """EC2 resource for the session's default region."""
+        with self._client_lock:
+            return self._session.resource('ec2', config=self._cfg)
+
+    @cached_property
+    def ce_client(self):
+        """Cost Explorer client."""
+        return self._client('ce', self._session.region_name)
+
+    @cached_property
+    def cloudwatch_client(self):
+        """CloudWatch client for the session's default region."""
+        return self._client('cloudwatch', self._session.region_name)
+
+    def _state_filters(self, service: str) -> Dict[str, Any]:
+        """Return describe_* keyword arguments that drop terminated resources, when enabled."""
+        if not self.skip_terminated:
+            return {}
+        return {'Filters': SKIP_TERMINATED_FILTERS[service]}
+
+    @cached_property
+    def _all_regions(self) -> List[str]:
+        """All regions enabled for the account, cached on disk for REGIONS_CACHE_TTL seconds."""
+        # Enabled regions differ between accounts, so keep one cache file per set of
+        # credentials. Hashing the access key avoids a network call to resolve the account.
+        cache_file = self._regions_cache_file()
+        try:
+            # --no-cache skips the cached list but still stores the fresh one
+            if cache_file is not None and not self.refresh_cache:
+                if time.time() - cache_file.stat().st_mtime < REGIONS_CACHE_TTL:
+                    return json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache, fetch from AWS instead
+
+        regions = [region['RegionName'] for region in self.ec2_client.describe_regions()['Regions']]
+
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(json.dumps(regions))
+            except OSError:
+                pass  # Caching is best-effort
+
+        return regions
+
+    def _regions_cache_file(self) -> Optional[Path]:
+        """Return the enabled-regions cache file for the current credentials, or None without any."""
+        credentials = self._session.get_credentials()
+        if credentials is None:
+            return None
+        key = f"{self._session.profile_name}:{credentials.access_key}"
+        return CACHE_DIR / f"regions-{hashlib.sha256(key.encode()).hexdigest()[:16]}.json"
+
+    def _get_regions(self) -> List[str]:
+        """Return the regions to scan: the configured list, or every enabled region."""
+        return self.regions_to_scan or self._all_regions
+
+    @cached_property
+    def _account_cache_dir(self) -> Optional[Path]:
+        """Directory for this account's cached discovery results, or None if the account is unknown."""
+        try:
+            identity = self._client('sts', self._session.region_name or 'us-east-1').get_caller_identity()
+        except (BotoCoreError, ClientError):
+            return None
+        return CACHE_DIR / identity['Account']
+
+    def _cache_file(self, service: str, region: str) -> Optional[Path]:
+        """Return the cache file for a regional scan, or None when caching is disabled."""
+        if not self.cache_ttl or self._account_cache_dir is None:
+            return None
+        # Skipping terminated resources changes the result set, so it gets its own file
+        suffix = '-active' if self.skip_terminated else ''
+        return self._account_cache_dir / region / f"{service}{suffix}.json"
+
+    def _cost_table(self, service: str, region: str) -> Dict[str, float]:
+        """Return the rates a regional service's records were priced with."""
+        return self._rates({'snapshots': 'snapshot'}.get(service, service), region)
+
+    def _read_cache(self, service: str, region: str) -> Optional[List[Dict[str, Any]]]:
+        """Return cached records for a regional scan younger than cache_ttl, or None."""
+        cache_file = self._cache_file(service, region)
+        if cache_file is None or self.refresh_cache:
+            return None
+        try:
+            if time.time() - cache_file.stat().st_mtime < self.cache_ttl:
+                cached = json.loads(cache_file.read_text())
+                # Records carry their costs, so only reuse them if they were priced the same way
+                if cached['rates'] == self._cost_table(service, region):
+                    return cached['records']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Missing, stale or unreadable cache, fetch from AWS instead
+        return None
+
+    def _write_cache(self, service: str, region: str, resources: List[Dict[str, Any]]) -> None:
+        """Store the records of a successful regional scan in the cache."""
+        if (service, region) in self._failed_scans:
+            self._failed_scans.discard((service, region))
+            return
+
+        cache_file = self._cache_file(service, region)
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({'rates': self._cost_table(service, region), 'records': resources}))
+        except OSError:
+            pass  # Caching is best-effort
+
+    def _discover_region_cached(self, service: str, region: str, discover_in_region) -> List[Dict[str, Any]]:
+        """Run a per-region discovery worker, reusing its cached result while fresh."""
+        resources = self._read_cache(service, region)
+        if resources is None:
+            resources = discover_in_region(region)
+            self._write_cache(service, region, resources)
+        return resources
+
+    def _region_error(self, service: str, region: str, error: Exception) -> List[Dict[str, Any]]:
+        """Report a failed regional scan and return its empty result."""
+        self._failed_scans.add((service, region))
+        self.print_red(f"    [WARNING] Error accessing region {region}: {str(error)}")
+        return []
+
+    def _scan_regions(self, service: str, discover_in_region, desc: str) -> List[Dict[str, Any]]:
+        """Run a per-region discovery worker across all regions concurrently."""
+        regions = self._get_regions()
+
+        def discover(region):
+            return self._discover_region_cached(service, region, discover_in_region)
+
+        # Region scans are bound by API round-trips, so run them in parallel
+        with ThreadPoolExecutor(max_workers=MAX_REGION_WORKERS) as executor:
+            results = list(tqdm(executor.map(discover, regions), total=len(regions),
+                                desc=desc, disable=self.quiet, colour='cyan'))
+
+        return list(chain.from_iterable(results))
+
+    def _store_regional(self, service: str, resources: List[Dict[str, Any]]) -> None:
+        """Store the discovered resources of a regional service."""
+        attribute, label = REGIONAL_SERVICES[service]
+        setattr(self, attribute, resources)
+        self.print_green(f"[SUCCESS] Found {len(resources)} {label}")
+
+    def _paginate_by_az(self, ec2, operation: str, **kwargs) -> List[Dict[str, Any]]:
+        """Fetch all pages of an EC2 describe call, paginating each Availability Zone concurrently."""
+        paginator = ec2.get_paginator(operation)
+        kwargs['PaginationConfig'] = {'PageSize': PAGE_SIZES[operation]}
+
+        try:
+            zones = [zone['ZoneName'] for zone in ec2.describe_availability_zones()['AvailabilityZones']]
+        except ClientError:
+            zones = []
+
+        # Partitioning only pays off when the region has several zones
+        if len(zones) <= 1:
+            return list(paginator.paginate(**kwargs))
+
+        def paginate_zone(zone):
+            filters = kwargs.get('Filters', []) + [{'Name': 'availability-zone', 'Values': [zone]}]
+            return list(paginator.paginate(**{**kwargs, 'Filters': filters}))
+
+        with ThreadPoolExecutor(max_workers=MAX_AZ_WORKERS) as executor:
+            return list(chain.from_iterable(executor.map(paginate_zone, zones)))
+
+    def _discover_ec2_in_region(self, region: str) -> List[Dict[str, Any]]:
+        """Discover all EC2 instances in a single region."""
+        self.print_cyan(f"  [REGION] Scanning region: {region}")
+
+        ec2 = self._ec2(region)
+
+        try:
+            # Describe all instances in the region, one paginator per Availability Zone
+            pages = self._paginate_by_az(ec2, 'describe_instances', **self._state_filters('ec2'))
+        except ClientError as e:
+            return self._region_error('ec2', region, e)
+
+        return self._ec2_rows(pages, region)
+
+    def _ec2_rows(self, pages, region: str) -> List[Dict[str, Any]]:
+        """Build EC2 instance records from describe_instances result pages."""
+        ec2_costs = self._rates('ec2', region)
+        now = datetime.now(timezone.utc)
+
+        return [_build_ec2_row(instance, region, ec2_costs, now)
+                for page in pages
+                for reservation in page['Reservations']
+                for instance in reservation['Instances']]
+
+    def discover_ec2_instances(self) -> List[Dict[str, Any]]:
+        """Discover all EC2 instances across all regions."""
+        self.print_cyan("[EC2] Discovering EC2 instances...")
 
+        try:
+            ec2_instances = self._scan_regions('ec2', self._discover_ec2_in_region, "Scanning regions for EC2")
         except ClientError as e:
             self.print_red(f"[ERROR] Error retrieving regions: {str(e)}")
             return []
 
-        self.print_green(f"[SUCCESS] Found {len(ec2_instances)} EC2 instances")
-        self.ec2_instances = ec2_instances
+        self._store_regional('ec2', ec2_instances)
         return ec2_instances
 
-    def discover_ebs_volumes(self) -> List[Dict[str, Any]]:
-        """Discover all EBS volumes across all regions."""
-        if not self.quiet:
-            self.print_cyan("[EBS] Discovering EBS volumes...")
+    def _discover_ebs_in_region(self, region: str) -> List[Dict[str, Any]]:
+        """Discover all EBS volumes in a single region."""
+        self.print_cyan(f"  [REGION] Scanning region: {region}")
 
-        ebs_volumes = []
+        ec2 = self._ec2(region)
 
         try:
-            # Get all regions or use provided list
-            if self.regions_to_scan:
-                regions = self.regions_to_scan
-            else:
-                # Get all regions
-                regions_response = self.ec2_client.describe_regions()
-                regions = [region['RegionName'] for region in regions_response['Regions']]
-
-            # Use tqdm for region scanning progress
-            for region in tqdm(regions, desc="Scanning regions for EBS", disable=self.quiet, colour='cyan'):
-                if not self.quiet:
-                    self.print_cyan(f"  [REGION] Scanning region: {region}")
-
-                ec2 = boto3.client('ec2', region_name=region)
-
-                try:
-                    # Describe all volumes in the region
-                    paginator = ec2.get_paginator('describe_volumes')
-                    page_iterator = paginator.paginate()
-
-                    for page in page_iterator:
-                        for volume in page['Volumes']:
-                            # Get volume cost
-                            volume_type = volume.get('VolumeType', 'gp2')
-                            size_gb = volume.get('Size', 0)
-                            monthly_cost = self.cost_constants['ebs'].get(volume_type, 0.10) * size_gb
-
-                            # Get volume tags
-                            tags = volume.get('Tags', [])
-                            name_tag = next((tag['Value'] for tag in tags if tag['Key'] == 'Name'), 'N/A')
-
-                            ebs_volume = {
-                                'VolumeId': volume.get('VolumeId'),
-                                'VolumeType': volume_type,
-                                'Size': size_gb,
-                                'State': volume.get('State'),
-                                'Region': region,
-                                'CreateTime': volume.get('CreateTime').isoformat(),
-                                'MonthlyCost': round(monthly_cost, 4),
-                                'Name': name_tag,
-                                'Encrypted': volume.get('Encrypted', False),
-                                'Iops': volume.get('Iops', 'N/A'),
-                                'Throughput': volume.get('Throughput', 'N/A'),
-                            }
-
-                            ebs_volumes.append(ebs_volume)
-
-                except ClientError as e:
-                    self.print_red(f"    [WARNING] Error accessing region {region}: {str(e)}")
-                    continue
+            # Describe all volumes in the region, one paginator per Availability Zone
+            pages = self._paginate_by_az(ec2, 'describe_volumes', **self._state_filters('ebs'))
+        except ClientError as e:
+            return self._region_error('ebs', region, e)
+
+        return self._ebs_rows(pages, region)
+
+    def _ebs_rows(self, pages, region: str) -> List[Dict[str, Any]]:
+        """Build EBS volume records from describe_volumes result pages."""
+        ebs_costs = self._rates('ebs', region)
+
+        return [_build_ebs_row(volume, region, ebs_costs) for page in pages for volume in page['Volumes']]
+
+    def discover_ebs_volumes(self) -> List[Dict[str, Any]]:
+        """Discover all EBS volumes across all regions."""
+        self.print_cyan("[EBS] Discovering EBS volumes...")
 
+        try:
+            ebs_volumes = self._scan_regions('ebs', self._discover_ebs_in_region, "Scanning regions for EBS")
         except ClientError as e:
             self.print_red(f"[ERROR] Error retrieving regions: {str(e)}")
             return []
 
-        self.print_green(f"[SUCCESS] Found {len(ebs_volumes)} EBS volumes")
-        self.ebs_volumes = ebs_volumes
+        self._store_regional('ebs', ebs_volumes)
         return ebs_volumes
 
+    def _bucket_size_bytes(self, bucket_name: str, region: str) -> Optional[float]:
+        """Return the latest daily Standard-class BucketSizeBytes for a bucket, or None if CloudWatch has none."""
+        cloudwatch = self._client('cloudwatch', region)
+        now = datetime.now(timezone.utc)
+        response = cloudwatch.get_metric_statistics(
+            Namespace='AWS/S3',
+            MetricName='BucketSizeBytes',
+            Dimensions=[
+                {'Name': 'BucketName', 'Value': bucket_name},
+                {'Name': 'StorageType', 'Value': 'StandardStorage'},
+            ],
+            StartTime=now - timedelta(days=2),
+            EndTime=now,
+            Period=86400,
+            Statistics=['Average'],
+        )
+
+        # Datapoints are not returned in order
+        datapoints = response['Datapoints']
+        if not datapoints:
+            # Buckets holding only Intelligent-Tiering, IA or Glacier data publish the metric for
+            # those storage types alone: that means 0 Standard bytes, not a missing metric
+            metrics = cloudwatch.list_metrics(
+                Namespace='AWS/S3',
+                MetricName='BucketSizeBytes',
+                Dimensions=[{'Name': 'BucketName', 'Value': bucket_name}],
+            )
+            return 0.0 if metrics['Metrics'] else None
+        return max(datapoints, key=lambda point: point['Timestamp'])['Average']
+
+    def _discover_s3_bucket(self, bucket: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build the record for a single S3 bucket, or None if its region cannot be determined."""
+        bucket_name = bucket['Name']
+        creation_date = bucket['CreationDate'].isoformat()
+
+        # Get bucket region
+        try:
+            location_response = self.s3_client.get_bucket_location(Bucket=bucket_name)
+            region = location_response.get('LocationConstraint')
+            if region is None:
+                region = 'us-east-1'  # Default region for us-east-1
+            elif region == 'EU':
+                region = 'eu-west-1'  # Legacy location constraint for eu-west-1
+        except ClientError as e:
+            self.print_red(f"    [WARNING] Could not get region for bucket {bucket_name}: {str(e)}")
+            return None
+
+        # Get bucket size from the daily CloudWatch storage metric
+        try:
+            size_bytes = self._bucket_size_bytes(bucket_name, region)
+            if size_bytes is None:
+                # No metric published for any storage type yet (new or empty bucket), so list every object instead
+                paginator = self.s3_client.get_paginator('list_objects_v2')
+                size_bytes = sum(obj['Size'] for page in paginator.paginate(Bucket=bucket_name)
+                                 for obj in page.get('Contents', ()))
+            size_gb = size_bytes / BYTES_PER_GB
+        except ClientError as e:
+            self.print_red(f"    [WARNING] Could not get size for bucket {bucket_name}: {str(e)}")
+            size_gb = 0
+
+        # Calculate approximate monthly cost (this is a rough estimate)
+        monthly_cost = size_gb * self.cost_constants['s3']['standard']
+
+        return {
+            'Name': bucket_name,
+            'CreationDate': creation_date,
+            'Region': region,
+            'SizeGB': round(size_gb, 4),
+            'MonthlyCost': round(monthly_cost, 4),
+            'Policy': 'N/A',  # Would need to check bucket policy
+            'Versioning': 'N/A',  # Would need to check versioning status
+            'Encryption': 'N/A',  # Would need to check encryption status
+        }
+
     def discover_s3_buckets(self) -> List[Dict[str, Any]]:
         """Discover all S3 buckets and their properties."""
-        if not self.quiet:
-            self.print_cyan("[S3] Discovering S3 buckets...")
-
-        s3_buckets = []
+        self.print_cyan("[S3] Discovering S3 buckets...")
 
         try:
             # List all buckets
             response = self.s3_client.list_buckets()
             buckets = response['Buckets']
 
-            # Use tqdm for resource discovery progress
-            for bucket in tqdm(buckets, desc="Discovering S3 buckets", disable=self.quiet, colour='cyan'):
-                bucket_name = bucket['Name']
-                creation_date = bucket['CreationDate'].isoformat()
-
-                # Get bucket region
-                try:
-                    location_response = self.s3_client.get_bucket_location(Bucket=bucket_name)
-                    region = location_response.get('LocationConstraint')
-                    if region is None:
-                        region = 'us-east-1'  # Default region for us-east-1
-                    else:
-                        region = region
-                except ClientError as e:
-                    self.print_red(f"    [WARNING] Could not get region for bucket {bucket_name}: {str(e)}")
-                    region = 'unknown'
-                    continue
-
-                # Get bucket size (approximate)
-                try:
-                    size_gb = 0
-                    objects_response = self.s3_client.list_objects_v2(Bucket=bucket_name)
-                    if 'Contents' in objects_response:
-                        for obj in objects_response['Contents']:
-                            size_gb += obj['Size']
-                    size_gb = size_gb / (1024 * 1024 * 1024)  # Convert to GB
-                except ClientError as e:
-                    self.print_red(f"    [WARNING] Could not get size for bucket {bucket_name}: {str(e)}")
-                    size_gb = 0
-
-                # Calculate approximate monthly cost (this is a rough estimate)
-                monthly_cost = size_gb * self.cost_constants['s3']['standard']
-
-                s3_bucket = {
-                    'Name': bucket_name,
-                    'CreationDate': creation_date,
-                    'Region': region,
-                    'SizeGB': round(size_gb, 4),
-                    'MonthlyCost': round(monthly_cost, 4),
-                    'Policy': 'N/A',  # Would need to check bucket policy
-                    'Versioning': 'N/A',  # Would need to check versioning status
-                    'Encryption': 'N/A',  # Would need to check encryption status
-                }
-
-                s3_buckets.append(s3_bucket)
+            # Size lookups are one CloudWatch call per bucket, so fan them out
+            with ThreadPoolExecutor(max_workers=MAX_BUCKET_WORKERS) as executor:
+                results = list(tqdm(executor.map(self._discover_s3_bucket, buckets), total=len(buckets),
+                                    desc="Discovering S3 buckets", disable=self.quiet, colour='cyan'))
 
         except ClientError as e:
             self.print_red(f"[ERROR] Error retrieving S3 buckets: {str(e)}")
             return []
 
+        s3_buckets = [s3_bucket for s3_bucket in results if s3_bucket is not None]
+
         self.print_green(f"[SUCCESS] Found {len(s3_buckets)} S3 buckets")
         self.s3_buckets = s3_buckets
         return s3_buckets
 
-    def discover_eips(self) -> List[Dict[str, Any]]:
-        """Discover all Elastic IP addresses."""
-        if not self.quiet:
-            self.print_cyan("[EIP] Discovering Elastic IPs...")
+    def _discover_eips_in_region(self, region: str) -> List[Dict[str, Any]]:
+        """Discover all Elastic IP addresses in a single region."""
+        self.print_cyan(f"  [REGION] Scanning region: {region}")
 
-        eips = []
+        ec2 = self._ec2(region)
 
         try:
-            # Get all regions or use provided list
-            if self.regions_to_scan:
-                regions = self.regions_to_scan
-            else:
-                # Get all regions
-                regions_response = self.ec2_client.describe_regions()
-                regions = [region['RegionName'] for region in regions_response['Regions']]
-
-            # Use tqdm for region scanning progress
-            for region in tqdm(regions, desc="Scanning regions for EIP", disable=self.quiet, colour='cyan'):
-                if not self.quiet:
-                    self.print_cyan(f"  [REGION] Scanning region: {region}")
-
-                ec2 = boto3.client('ec2', region_name=region)
-
-                try:
-                    # Describe all EIPs in the region
-                    response = ec2.describe_addresses()
-
-                    for address in response['Addresses']:
-                        # Calculate monthly cost based on whether EIP is associated
-                        is_associated = address.get('InstanceId') or address.get('NetworkInterfaceId') or address.get('AssociationId')
-                        hourly_rate = 0 if is_associated else self.cost_constants['eip']['hourly_rate']
-                        monthly_cost = hourly_rate * 730  # 730 hours in a month
-
-                        eip = {
-                            'PublicIp': address.get('PublicIp'),
-                            'AllocationId': address.get('AllocationId'),
-                            'Domain': address.get('Domain'),
-                            'Region': region,
-                            'InstanceId': address.get('InstanceId', 'N/A'),
-                            'NetworkInterfaceId': address.get('NetworkInterfaceId', 'N/A'),
-                            'IsAssociated': is_associated,
-                            'HourlyCost': hourly_rate,
-                            'MonthlyCost': round(monthly_cost, 4),
-                        }
-
-                        eips.append(eip)
-
-                except ClientError as e:
-                    self.print_red(f"    [WARNING] Error accessing region {region}: {str(e)}")
-                    continue
+            # Describe all EIPs in the region
+            addresses = ec2.describe_addresses()['Addresses']
+        except ClientError as e:
+            return self._region_error('eip', region, e)
+
+        return self._eip_rows(addresses, region)
+
+    def _eip_rows(self, addresses, region: str) -> List[Dict[str, Any]]:
+        """Build Elastic IP records from describe_addresses results."""
+        unattached_rate = self.cost_constants['eip']['hourly_rate']
 
+        return [_build_eip_row(address, region, unattached_rate) for address in addresses]
+
+    def discover_eips(self) -> List[Dict[str, Any]]:
+        """Discover all Elastic IP addresses."""
+        self.print_cyan("[EIP] Discovering Elastic IPs...")
+
+        try:
+            eips = self._scan_regions('eip', self._discover_eips_in_region, "Scanning regions for EIP")
         except ClientError as e:
             self.print_red(f"[ERROR] Error retrieving regions: {str(e)}")
             return []
 
-        self.print_green(f"[SUCCESS] Found {len(eips)} Elastic IPs")
-        self.eips = eips
+        self._store_regional('eip', eips)
         return eips
 
-    def discover_snapshots(self) -> List[Dict[str, Any]]:
-        """Discover all EBS snapshots."""
-        if not self.quiet:
-            self.print_cyan("[SNAPSHOT] Discovering EBS snapshots...")
+    def _discover_snapshots_in_region(self, region: str) -> List[Dict[str, Any]]:
+        """Discover all EBS snapshots owned by the account in a single region."""
+        self.print_cyan(f"  [REGION] Scanning region: {region}")
 
-        snapshots = []
+        ec2 = self._ec2(region)
 
         try:
-            # Get all regions or use provided list
-            if self.regions_to_scan:
-                regions = self.regions_to_scan
-            else:
-                # Get all regions
-                regions_response = self.ec2_client.describe_regions()
-                regions = [region['RegionName'] for region in regions_response['Regions']]
-
-            # Use tqdm for region scanning progress
-            for region in tqdm(regions, desc="Scanning regions for snapshots", disable=self.quiet, colour='cyan'):
-                if not self.quiet:
-                    self.print_cyan(f"  [REGION] Scanning region: {region}")
-
-                ec2 = boto3.client('ec2', region_name=region)
-
-                try:
-                    # Describe all snapshots in the region (only owned by the account)
-                    paginator = ec2.get_paginator('describe_snapshots')
-                    page_iterator = paginator.paginate(OwnerIds=['self'])
-
-                    for page in page_iterator:
-                        for snapshot in page['Snapshots']:
-                            # Get snapshot size and calculate cost
-                            volume_size = snapshot.get('VolumeSize', 0)  # in GB
-                            # Calculate cost based on size (simplified)
-                            monthly_cost = volume_size * self.cost_constants['snapshot']['per_gb_month']
-
-                            # Get snapshot tags
-                            tags = snapshot.get('Tags', [])
-                            name_tag = next((tag['Value'] for tag in tags if tag['Key'] == 'Name'), 'N/A')
-
-                            snap = {
-                                'SnapshotId': snapshot.get('SnapshotId'),
-                                'VolumeId': snapshot.get('VolumeId', 'N/A'),
-                                'State': snapshot.get('State'),
-                                'StartTime': snapshot.get('StartTime').isoformat(),
-                                'VolumeSize': volume_size,
-                                'Region': region,
-                                'Description': snapshot.get('Description', 'N/A'),
-                                'Name': name_tag,
-                                'MonthlyCost': round(monthly_cost, 4),
-                            }
-
-                            snapshots.append(snap)
-
-                except ClientError as e:
-                    self.print_red(f"    [WARNING] Error accessing region {region}: {str(e)}")
-                    continue
+            # Describe all snapshots in the region (only owned by the account)
+            paginator = ec2.get_paginator('describe_snapshots')
+            pages = list(paginator.paginate(OwnerIds=['self'], PaginationConfig={'PageSize': PAGE_SIZES['describe_snapshots']},
+                                            **self._state_filters('snapshots')))
+        except ClientError as e:
+            return self._region_error('snapshots', region, e)
+
+        return self._snapshot_rows(pages, region)
+
+    def _snapshot_rows(self, pages, region: str) -> List[Dict[str, Any]]:
+        """Build snapshot records from describe_snapshots result pages."""
+        per_gb_month = self._rates('snapshot', region)['per_gb_month']
 
+        return [_build_snapshot_row(snapshot, region, per_gb_month)
+                for page in pages for snapshot in page['Snapshots']]
+
+    def discover_snapshots(self) -> List[Dict[str, Any]]:
+        """Discover all EBS snapshots."""
+        self.print_cyan("[SNAPSHOT] Discovering EBS snapshots...")
+
+        try:
+            snapshots = self._scan_regions('snapshots', self._discover_snapshots_in_region, "Scanning regions for snapshots")
         except ClientError as e:
             self.print_red(f"[ERROR] Error retrieving regions: {str(e)}")
             return []
 
-        self.print_green(f"[SUCCESS] Found {len(snapshots)} snapshots")
-        self.snapshots = snapshots
+        self._store_regional('snapshots', snapshots)
         return snapshots
 
+    async def _discover_in_region_async(self, session, service: str, region: str) -> List[Dict[str, Any]]:
+        """Fetch and build records for one regional service using an aioboto3 client."""
+        self.print_cyan(f"  [REGION] Scanning {service} in region: {region}")
+
+        try:
+            async with session.client('ec2', region_name=region, config=self._cfg) as ec2:
+                if service == 'eip':
+                    response = await ec2.describe_addresses()
+                    return self._eip_rows(response['Addresses'], region)
+
+                operation, kwargs, build_rows = {
+                    'ec2': ('describe_instances', self._state_filters('ec2'), self._ec2_rows),
+                    'ebs': ('describe_volumes', self._state_filters('ebs'), self._ebs_rows),
+                    'snapshots': ('describe_snapshots', {'OwnerIds': ['self'], **self._state_filters('snapshots')},
+                                  self._snapshot_rows),
+                }[service]
+                paginator = ec2.get_paginator(operation)
+                pages = [page async for page in paginator.paginate(
+                    PaginationConfig={'PageSize': PAGE_SIZES[operation]}, **kwargs)]
+                return build_rows(pages, region)
+        except ClientError as e:
+            return self._region_error(service, region, e)
+
+    async def discover_all_async(self, services_to_scan=None) -> None:
+        """Discover all requested services across all regions concurrently on one event loop.
+
+        Requires the optional aioboto3 package.
+        """
+        if aioboto3 is None:
+            raise ImportError("aioboto3 is required for asynchronous discovery (pip install aioboto3)")
+
+        if not services_to_scan:
+            services_to_scan = ALL_SERVICES
+
+        loop = asyncio.get_running_loop()
+        regional_services = [service for service in REGIONAL_SERVICES if service in services_to_scan]
+
+        try:
+            regions = await loop.run_in_executor(None, self._get_regions) if regional_services else []
+        except ClientError as e:
+            self.print_red(f"[ERROR] Error retrieving regions: {str(e)}")
+            regional_services, regions = [], []
+
+        if self.cache_ttl:
+            # Resolve the account (a blocking STS call) before the cache is read from the event loop
+            await loop.run_in_executor(None, getattr, self, '_account_cache_dir')
+
+        session = aioboto3.Session(profile_name=self.profile_name)
+
+        async def discover(service, region):
+            resources = self._read_cache(service, region)
+            if resources is None:
+                resources = await self._discover_in_region_async(session, service, region)
+                self._write_cache(service, region, resources)
+            return resources
+
+        tasks = [discover(service, region) for service in regional_services for region in regions]
+
+        # S3 listing is global, so it keeps the threaded path and overlaps with the regional calls
+        if 's3' in services_to_scan:
+            tasks.append(loop.run_in_executor(None, self.discover_s3_buckets))
+
+        results = iter(await asyncio.gather(*tasks))
+
+        for service in regional_services:
+            self._store_regional(service, list(chain.from_iterable(next(results) for _ in regions)))
+
+    def _discover_all(self, services_to_scan) -> None:
+        """Discover all requested services, running every (service, region) pair in one task pool."""
+        regional_services = [service for service in REGIONAL_SERVICES if service in services_to_scan]
+
+        try:
+            regions = self._get_regions() if regional_services else []
+        except ClientError as e:
+            self.print_red(f"[ERROR] Error retrieving regions: {str(e)}")
+            regional_services, regions = [], []
+
+        workers = {
+            'ec2': self._discover_ec2_in_region,
+            'ebs': self._discover_ebs_in_region,
+            'eip': self._discover_eips_in_region,
+            'snapshots': self._discover_snapshots_in_region,
+        }
+        # Regions still to scan per service. Each service keeps at most MAX_SERVICE_WORKERS
+        # tasks in the pool and submits its next region as one finishes, so no pool thread
+        # waits on another service's limit.
+        pending = {service: deque(regions) for service in regional_services}
+        futures = {}
+        results = {}
+
+        def submit_next(service):
+            if pending[service]:
+                region = pending[service].popleft()
+                future = executor.submit(self._discover_region_cached, service, region, workers[service])
+                futures[future] = (service, region)
+
+        with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+            # S3 listing is global, so it runs as a single task alongside the regional ones
+            s3_future = executor.submit(self.discover_s3_buckets) if 's3' in services_to_scan else None
+
+            for service in regional_services:
+                for _ in range(MAX_SERVICE_WORKERS):
+                    submit_next(service)
+
+            with tqdm(total=len(regional_services) * len(regions), desc="Scanning regions",
+                      disable=self.quiet, colour='cyan') as progress:
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        service, region = futures.pop(future)
+                        results[service, region] = future.result()
+                        progress.update()
+                        submit_next(service)
+
+            if s3_future is not None:
+                s3_future.result()
+
+        # Merge in region order so reports do not depend on completion order
+        for service in regional_services:
+            self._store_regional(service, list(chain.from_iterable(results[service, region] for region in regions)))
+
     def calculate_total_costs(self) -> Dict[str, float]:
         """Calculate total costs for all resource types."""
-        if not self.quiet:
-            self.print_cyan("[COST] Calculating total costs...")
+        self.print_cyan("[COST] Calculating total costs...")
 
-        total_ec2 = sum(instance['MonthlyCost'] for instance in self.ec2_instances)
-        total_ebs = sum(volume['MonthlyCost'] for volume in self.ebs_volumes)
-        total_s3 = sum(bucket['MonthlyCost'] for bucket in self.s3_buckets)
-        total_eip = sum(eip['MonthlyCost'] for eip in self.eips)
-        total_snapshots = sum(snapshot['MonthlyCost'] for snapshot in self.snapshots)
+        get_cost = itemgetter('MonthlyCost')
+        total_ec2 = sum(map(get_cost, self.ec2_instances))
+        total_ebs = sum(map(get_cost, self.ebs_volumes))
+        total_s3 = sum(map(get_cost, self.s3_buckets))
+        total_eip = sum(map(get_cost, self.eips))
+        total_snapshots = sum(map(get_cost, self.snapshots))
 
         total_cost = total_ec2 + total_ebs + total_s3 + total_eip + total_snapshots
 
@@ -468,166 +1042,37 @@ class CloudResourceArchaeologist:
         self.print_green(f"[SUCCESS] Total monthly cost: ${total_cost:.2f}")
         return cost_summary
 
-    def generate_report(self, output_format='txt', output_filename=None) -> str:
-        """Generate a professional report of all findings."""
-        if not self.quiet:
-            self.print_cyan("[REPORT] Generating professional report...")
-
-        # Calculate totals
-        cost_summary = self.calculate_total_costs()
-
-        # Create report header
-        report_lines = []
-        report_lines.append("=" * 80)
-        report_lines.append("CLOUD RESOURCE ARCHAEOLOGIST REPORT")
-        report_lines.append("=" * 80)
-        report_lines.append(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("")
-
-        # Summary section
-        report_lines.append("SUMMARY")
-        report_lines.append("-" * 20)
-        report_lines.append(f"Total Resources Found:")
-        report_lines.append(f"  EC2 Instances: {len(self.ec2_instances)}")
-        report_lines.append(f"  EBS Volumes: {len(self.ebs_volumes)}")
-        report_lines.append(f"  S3 Buckets: {len(self.s3_buckets)}")
-        report_lines.append(f"  Elastic IPs: {len(self.eips)}")
-        report_lines.append(f"  Snapshots: {len(self.snapshots)}")
-        report_lines.append("")
-
-        # Cost summary
-        report_lines.append("COST SUMMARY")
-        report_lines.append("-" * 20)
-        report_lines.append(f"EC2 Monthly Cost: ${cost_summary['EC2']:.2f}")
-        report_lines.append(f"EBS Monthly Cost: ${cost_summary['EBS']:.2f}")
-        report_lines.append(f"S3 Monthly Cost: ${cost_summary['S3']:.2f}")
-        report_lines.append(f"EIP Monthly Cost: ${cost_summary['EIP']:.2f}")
-        report_lines.append(f"Snapshot Monthly Cost: ${cost_summary['Snapshots']:.2f}")
-        report_lines.append(f"TOTAL Monthly Cost: ${cost_summary['Total']:.2f}")
-        report_lines.append("")
-
-        # EC2 instances details
-        if self.ec2_instances:
-            report_lines.append("EC2 INSTANCES")
-            report_lines.append("-" * 20)
-            report_lines.append(f"{'Instance ID':<20} {'Type':<15} {'State':<12} {'Region':<15} {'Monthly Cost':<15} {'Name':<20}")
-            report_lines.append("-" * 100)
-            for instance in tqdm(self.ec2_instances, desc="Generating EC2 report", disable=self.quiet, colour='blue'):
-                report_lines.append(
-                    f"{instance['InstanceId']:<20} "
-                    f"{instance['InstanceType']:<15} "
-                    f"{instance['State']:<12} "
-                    f"{instance['Region']:<15} "
-                    f"${instance['MonthlyCost']:<14.2f} "
-                    f"{instance['Name']:<20}"
-                )
-            report_lines.append("")
-
-        # EBS volumes details
-        if self.ebs_volumes:
-            report_lines.append("EBS VOLUMES")
-            report_lines.append("-" * 20)
-            report_lines.append(f"{'Volume ID':<20} {'Type':<10} {'Size (GB)':<12} {'State':<12} {'Region':<15} {'Monthly Cost':<15} {'Name':<20}")
-            report_lines.append("-" * 100)
-            for volume in tqdm(self.ebs_volumes, desc="Generating EBS report", disable=self.quiet, colour='blue'):
-                report_lines.append(
-                    f"{volume['VolumeId']:<20} "
-                    f"{volume['VolumeType']:<10} "
-                    f"{volume['Size']:<12} "
-                    f"{volume['State']:<12} "
-                    f"{volume['Region']:<15} "
-                    f"${volume['MonthlyCost']:<14.2f} "
-                    f"{volume['Name']:<20}"
-                )
-            report_lines.append("")
+    def generate_report(self, output_format='txt', output_filename=None, cost_summary=None) -> str:
+        """Generate a professional report of all findings.
 
-        # S3 buckets details
-        if self.s3_buckets:
-            report_lines.append("S3 BUCKETS")
-            report_lines.append("-" * 20)
-            report_lines.append(f"{'Bucket Name':<30} {'Region':<15} {'Size (GB)':<15} {'Monthly Cost':<15}")
-            report_lines.append("-" * 80)
-            for bucket in tqdm(self.s3_buckets, desc="Generating S3 report", disable=self.quiet, colour='blue'):
-                report_lines.append(
-                    f"{bucket['Name']:<30} "
-                    f"{bucket['Region']:<15} "
-                    f"{bucket['SizeGB']:<15.2f} "
-                    f"${bucket['MonthlyCost']:<14.2f}"
-                )
-            report_lines.append("")
-
-        # EIP details
-        if self.eips:
-            report_lines.append("ELASTIC IPs")
-            report_lines.append("-" * 20)
-            report_lines.append(f"{'Public IP':<15} {'Region':<15} {'Associated':<12} {'Monthly Cost':<15}")
-            report_lines.append("-" * 70)
-            for eip in tqdm(self.eips, desc="Generating EIP report", disable=self.quiet, colour='blue'):
-                report_lines.append(
-                    f"{eip['PublicIp']:<15} "
-                    f"{eip['Region']:<15} "
-                    f"{'Yes' if eip['IsAssociated'] else 'No':<12} "
-                    f"${eip['MonthlyCost']:<14.2f}"
-                )
-            report_lines.append("")
+        cost_summary may pass in an existing calculate_total_costs() result to avoid recomputing it.
+        """
+        self.print_cyan("[REPORT] Generating professional report...")
 
-        # Snapshot details
-        if self.snapshots:
-            report_lines.append("SNAPSHOTS")
-            report_lines.append("-" * 20)
-            report_lines.append(f"{'Snapshot ID':<25} {'Volume ID':<20} {'State':<12} {'Size (GB)':<12} {'Region':<15} {'Monthly Cost':<15} {'Name':<20}")
-            report_lines.append("-" * 110)
-            for snapshot in tqdm(self.snapshots, desc="Generating snapshot report", disable=self.quiet, colour='blue'):
-                report_lines.append(
-                    f"{snapshot['SnapshotId']:<25} "
-                    f"{snapshot['VolumeId']:<20} "
-                    f"{snapshot['State']:<12} "
-                    f"{snapshot['VolumeSize']:<12} "
-                    f"{snapshot['Region']:<15} "
-                    f"${snapshot['MonthlyCost']:<14.2f} "
-                    f"{snapshot['Name']:<20}"
-                )
-            report_lines.append("")
+        ec2_instances, ebs_volumes, s3_buckets, eips, snapshots = (
+            self.ec2_instances, self.ebs_volumes, self.s3_buckets, self.eips, self.snapshots)
 
-        # Recommendations section
-        report_lines.append("RECOMMENDATIONS")
-        report_lines.append("-" * 20)
+        # Calculate totals
+        if cost_summary is None:
+            cost_summary = self.calculate_total_costs()
 
-        # Check for unused resources
-        unused_ec2 = [inst for inst in self.ec2_instances if inst['State'] == 'stopped']
-        unattached_ebs = [vol for vol in self.ebs_volumes if vol['State'] == 'available']
-        unassociated_eips = [eip for eip in self.eips if not eip['IsAssociated']]
+        # Check for unused resources, counting straight from the lists so the report always agrees with them
+        unused_ec2 = sum(1 for instance in ec2_instances if instance['State'] == 'stopped')
+        unattached_ebs = sum(1 for volume in ebs_volumes if volume['State'] == 'available')
+        unassociated_eips = sum(1 for eip in eips if not eip['IsAssociated'])
 
+        recommendations = []
         if unused_ec2:
-            recommendation = f"[WARNING] Found {len(unused_ec2)} stopped EC2 instances that may be costing money"
-            report_lines.append(recommendation)
-            if not self.quiet:
-                self.print_yellow(recommendation)
-
+            recommendations.append(f"[WARNING] Found {unused_ec2} stopped EC2 instances that may be costing money")
         if unattached_ebs:
-            recommendation = f"[WARNING] Found {len(unattached_ebs)} unattached EBS volumes that may be costing money"
-            report_lines.append(recommendation)
-            if not self.quiet:
-                self.print_yellow(recommendation)
-
+            recommendations.append(f"[WARNING] Found {unattached_ebs} unattached EBS volumes that may be costing money")
         if unassociated_eips:
-            recommendation = f"[WARNING] Found {len(unassociated_eips)} unassociated Elastic IPs that are incurring charges"
-            report_lines.append(recommendation)
-            if not self.quiet:
-                self.print_yellow(recommendation)
-
-        if not unused_ec2 and not unattached_ebs and not unassociated_eips:
-            success_msg = "[SUCCESS] No obviously unused resources found"
-            report_lines.append(success_msg)
-            if not self.quiet:
-                self.print_green(success_msg)
+            recommendations.append(f"[WARNING] Found {unassociated_eips} unassociated Elastic IPs that are incurring charges")
 
-        report_lines.append("")
-        report_lines.append("=" * 80)
-        report_lines.append("END OF REPORT")
-        report_lines.append("=" * 80)
-
-        report_str = "\n".join(report_lines)
+        for recommendation in recommendations:
+            self.print_yellow(recommendation)
+        if not recommendations:
+            self.print_green(NO_RECOMMENDATIONS)
 
         # Determine filename based on output format and optional output filename
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -652,28 +1097,27 @@ class CloudResourceArchaeologist:
                 filename = f"cloud_archaeologist_report_{timestamp}.txt"
 
         if output_format.lower() == 'csv':
-            # Convert report to CSV format
-            import io
-            import csv
-
-            output = io.StringIO()
-            writer = csv.writer(output)
-
-            # Write all report lines as rows
-            for line in report_lines:
-                if line.strip():
-                    # Try to detect table headers and split appropriately
-                    if '|' in line:
-                        row_data = [cell.strip() for cell in line.split('|')]
-                    else:
-                        row_data = [line]
-                    writer.writerow(row_data)
-
-            csv_content = output.getvalue()
-            output.close()
-
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(csv_content)
+            # One table per resource type, each with a title row and a header row
+            with open(filename, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                for title, resources in (('EC2 INSTANCES', ec2_instances), ('EBS VOLUMES', ebs_volumes),
+                                         ('S3 BUCKETS', s3_buckets), ('ELASTIC IPs', eips),
+                                         ('SNAPSHOTS', snapshots)):
+                    if not resources:
+                        continue
+                    columns = list(resources[0])
+                    writer.writerow([title])
+                    writer.writerow(columns)
+                    writer.writerows(map(itemgetter(*columns), resources))
+                    writer.writerow([])
+
+                writer.writerow(['COST SUMMARY'])
+                writer.writerow(['Service', 'MonthlyCost'])
+                writer.writerows(cost_summary.items())
+                writer.writerow([])
+
+                writer.writerow(['RECOMMENDATIONS'])
+                writer.writerows([recommendation] for recommendation in recommendations or [NO_RECOMMENDATIONS])
 
         elif output_format.lower() == 'json':
             # Convert all data to JSON format
@@ -683,121 +1127,232 @@ class CloudResourceArchaeologist:
                     'version': VERSION
                 },
                 'summary': {
-                    'total_ec2_instances': len(self.ec2_instances),
-                    'total_ebs_volumes': len(self.ebs_volumes),
-                    'total_s3_buckets': len(self.s3_buckets),
-                    'total_eips': len(self.eips),
-                    'total_snapshots': len(self.snapshots)
+                    'total_ec2_instances': len(ec2_instances),
+                    'total_ebs_volumes': len(ebs_volumes),
+                    'total_s3_buckets': len(s3_buckets),
+                    'total_eips': len(eips),
+                    'total_snapshots': len(snapshots)
                 },
-                'cost_summary': self.calculate_total_costs(),
+                'cost_summary': cost_summary,
                 'resources': {
-                    'ec2_instances': self.ec2_instances,
-                    'ebs_volumes': self.ebs_volumes,
-                    's3_buckets': self.s3_buckets,
-                    'elastic_ips': self.eips,
-                    'snapshots': self.snapshots
+                    'ec2_instances': ec2_instances,
+                    'ebs_volumes': ebs_volumes,
+                    's3_buckets': s3_buckets,
+                    'elastic_ips': eips,
+                    'snapshots': snapshots
                 },
                 'recommendations': {
-                    'unused_ec2_instances': len([inst for inst in self.ec2_instances if inst['State'] == 'stopped']),
-                    'unattached_ebs_volumes': len([vol for vol in self.ebs_volumes if vol['State'] == 'available']),
-                    'unassociated_eips': len([eip for eip in self.eips if not eip['IsAssociated']])
+                    'unused_ec2_instances': unused_ec2,
+                    'unattached_ebs_volumes': unattached_ebs,
+                    'unassociated_eips': unassociated_eips
                 }
             }
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(report_json, f, indent=2, default=str)
+            # Records hold only JSON-native values (timestamps are ISO strings from discovery),
+            # so neither encoder needs a fallback hook
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(report_json, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'wb') as f:
+                    f.write(json.dumps(report_json, indent=2).encode('utf-8'))
         else:  # Default to TXT
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(report_str)
+            report_str = self._text_report(cost_summary, recommendations)
+
+            # Encode once and write the bytes in a single call, skipping the text layer
+            with open(filename, 'wb') as f:
+                f.write(report_str.encode('utf-8'))
 
         self.print_green(f"[SUCCESS] Report saved to {filename}")
         return report_str if output_format.lower() == 'txt' else f"[SUCCESS] {output_format.upper()} report saved to {filename}"
 
+    def _text_report(self, cost_summary: Dict[str, float], recommendations: List[str]) -> str:
+        """Render the plain-text report."""
+        ec2_instances, ebs_volumes, s3_buckets, eips, snapshots = (
+            self.ec2_instances, self.ebs_volumes, self.s3_buckets, self.eips, self.snapshots)
+
+        # Create report header
+        report = io.StringIO()
+        print("=" * 80, file=report)
+        print("CLOUD RESOURCE ARCHAEOLOGIST REPORT", file=report)
+        print("=" * 80, file=report)
+        print(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=report)
+        print("", file=report)
+
+        # Summary section
+        print("SUMMARY", file=report)
+        print("-" * 20, file=report)
+        print(f"Total Resources Found:", file=report)
+        print(f"  EC2 Instances: {len(ec2_instances)}", file=report)
+        print(f"  EBS Volumes: {len(ebs_volumes)}", file=report)
+        print(f"  S3 Buckets: {len(s3_buckets)}", file=report)
+        print(f"  Elastic IPs: {len(eips)}", file=report)
+        print(f"  Snapshots: {len(snapshots)}", file=report)
+        print("", file=report)
+
+        # Cost summary
+        print("COST SUMMARY", file=report)
+        print("-" * 20, file=report)
+        print(f"EC2 Monthly Cost: ${cost_summary['EC2']:.2f}", file=report)
+        print(f"EBS Monthly Cost: ${cost_summary['EBS']:.2f}", file=report)
+        print(f"S3 Monthly Cost: ${cost_summary['S3']:.2f}", file=report)
+        print(f"EIP Monthly Cost: ${cost_summary['EIP']:.2f}", file=report)
+        print(f"Snapshot Monthly Cost: ${cost_summary['Snapshots']:.2f}", file=report)
+        print(f"TOTAL Monthly Cost: ${cost_summary['Total']:.2f}", file=report)
+        print("", file=report)
+
+        # EC2 instances details
+        if ec2_instances:
+            print("EC2 INSTANCES", file=report)
+            print("-" * 20, file=report)
+            print(f"{'Instance ID':<20} {'Type':<15} {'State':<12} {'Region':<15} {'Monthly Cost':<15} {'Name':<20}", file=report)
+            print("-" * 100, file=report)
+            report.writelines(map(EC2_ROW_FORMAT.format_map, ec2_instances))
+            print("", file=report)
+
+        # EBS volumes details
+        if ebs_volumes:
+            print("EBS VOLUMES", file=report)
+            print("-" * 20, file=report)
+            print(f"{'Volume ID':<20} {'Type':<10} {'Size (GB)':<12} {'State':<12} {'Region':<15} {'Monthly Cost':<15} {'Name':<20}", file=report)
+            print("-" * 100, file=report)
+            report.writelines(map(EBS_ROW_FORMAT.format_map, ebs_volumes))
+            print("", file=report)
+
+        # S3 buckets details
+        if s3_buckets:
+            print("S3 BUCKETS", file=report)
+            print("-" * 20, file=report)
+            print(f"{'Bucket Name':<30} {'Region':<15} {'Size (GB)':<15} {'Monthly Cost':<15}", file=report)
+            print("-" * 80, file=report)
+            report.writelines(map(S3_ROW_FORMAT.format_map, s3_buckets))
+            print("", file=report)
+
+        # EIP details
+        if eips:
+            print("ELASTIC IPs", file=report)
+            print("-" * 20, file=report)
+            print(f"{'Public IP':<15} {'Region':<15} {'Associated':<12} {'Monthly Cost':<15}", file=report)
+            print("-" * 70, file=report)
+            for eip in eips:
+                report.write(EIP_ROW_FORMAT.format_map({**eip, 'Associated': 'Yes' if eip['IsAssociated'] else 'No'}))
+            print("", file=report)
+
+        # Snapshot details
+        if snapshots:
+            print("SNAPSHOTS", file=report)
+            print("-" * 20, file=report)
+            print(f"{'Snapshot ID':<25} {'Volume ID':<20} {'State':<12} {'Size (GB)':<12} {'Region':<15} {'Monthly Cost':<15} {'Name':<20}", file=report)
+            print("-" * 110, file=report)
+            report.writelines(map(SNAPSHOT_ROW_FORMAT.format_map, snapshots))
+            print("", file=report)
+
+        # Recommendations section
+        print("RECOMMENDATIONS", file=report)
+        print("-" * 20, file=report)
+        print("\n".join(recommendations or [NO_RECOMMENDATIONS]), file=report)
+
+        print("", file=report)
+        print("=" * 80, file=report)
+        print("END OF REPORT", file=report)
+        print("=" * 80, file=report)
+
+        return report.getvalue()
+
     def run_full_scan(self, output_format='txt', services_to_scan=None, output_filename=None):
         """Run a scan of AWS resources with specified services and regions."""
-        if not self.quiet:
-            self.print_cyan("[SCAN] Starting Cloud Resource Archaeologist scan...")
-            if services_to_scan:
-                self.print_cyan(f"[SCAN] Scanning services: {', '.join(services_to_scan)}")
-            if self.regions_to_scan:
-                self.print_cyan(f"[SCAN] Scanning regions: {', '.join(self.regions_to_scan)}")
-            self.print_cyan("")
-
-        # If no services specified, scan all
-        if not services_to_scan:
-            services_to_scan = ['ec2', 'ebs', 's3', 'eip', 'snapshots']
+        services_to_scan = self._begin_scan(services_to_scan)
 
         # Discover resources based on specified services
-        if 'ec2' in services_to_scan:
-            self.discover_ec2_instances()
-            if not self.quiet:
-                self.print_cyan("")
+        self._discover_all(services_to_scan)
 
-        if 'ebs' in services_to_scan:
-            self.discover_ebs_volumes()
-            if not self.quiet:
-                self.print_cyan("")
+        self._finish_scan(output_format, output_filename)
 
-        if 's3' in services_to_scan:
-            self.discover_s3_buckets()
-            if not self.quiet:
-                self.print_cyan("")
+    async def run_full_scan_async(self, output_format='txt', services_to_scan=None, output_filename=None):
+        """Run a scan like run_full_scan, discovering resources with aioboto3 on one event loop.
+
+        Falls back to threaded discovery when aioboto3 is not installed.
+        """
+        services_to_scan = self._begin_scan(services_to_scan)
+
+        if aioboto3 is None:
+            self.print_yellow("[WARNING] aioboto3 is not installed, falling back to threaded discovery")
+            await asyncio.get_running_loop().run_in_executor(None, self._discover_all, services_to_scan)
+        else:
+            await self.discover_all_async(services_to_scan)
+
+        self._finish_scan(output_format, output_filename)
 
-        if 'eip' in services_to_scan:
-            self.discover_eips()
-            if not self.quiet:
-                self.print_cyan("")
+    def _begin_scan(self, services_to_scan) -> Sequence[str]:
+        """Announce a scan and return the services to scan, defaulting to all of them."""
+        self.print_cyan("[SCAN] Starting Cloud Resource Archaeologist scan...")
+        if services_to_scan:
+            self.print_cyan(f"[SCAN] Scanning services: {', '.join(services_to_scan)}")
+        if self.regions_to_scan:
+            self.print_cyan(f"[SCAN] Scanning regions: {', '.join(self.regions_to_scan)}")
+        self.print_cyan("")
 
-        if 'snapshots' in services_to_scan:
-            self.discover_snapshots()
-            if not self.quiet:
-                self.print_cyan("")
+        # If no services specified, scan all
+        if not services_to_scan:
+            services_to_scan = ALL_SERVICES
+
+        return services_to_scan
 
-        # Generate the report
-        report = self.generate_report(output_format, output_filename)
+    def _finish_scan(self, output_format, output_filename) -> None:
+        """Write the report for the discovered resources and print the scan summary."""
+        self.print_cyan("")
 
-        if not self.quiet:
-            self.print_cyan("")
+        # Generate the report, sharing one cost calculation with the summary below
+        costs = self.calculate_total_costs()
+        report = self.generate_report(output_format, output_filename, cost_summary=costs)
+
+        self.print_cyan("")
         self.print_green("[SUCCESS] Cloud Resource Archaeologist scan completed!")
         self.print_green(f"[SUMMARY] Total resources discovered: {len(self.ec2_instances) + len(self.ebs_volumes) + len(self.s3_buckets) + len(self.eips) + len(self.snapshots)}")
-        self.print_green(f"[COST] Total estimated monthly cost: ${sum(self.calculate_total_costs().values()) - self.calculate_total_costs()['Total'] + self.calculate_total_costs()['Total']:.2f}")
+        self.print_green(f"[COST] Total estimated monthly cost: ${costs['Total']:.2f}")
 
 
-def main():
-    """Main function to run the Cloud Resource Archaeologist."""
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once and reuse it on later calls."""
     parser = argparse.ArgumentParser(description='Cloud Resource Archaeologist - AWS Resource Discovery and Cost Analysis')
     parser.add_argument('--profile', type=str, help='AWS profile name to use')
     parser.add_argument('--services', type=str, help='Services to scan: ec2, ebs, s3, eip, snapshots, or all (comma-separated)')
     parser.add_argument('--regions', type=str, help='Regions to scan (comma-separated) or "all" (default: all regions)')
     parser.add_argument('--no-cost', action='store_true', help='Skip AWS pricing calculations')
+    parser.add_argument('--skip-terminated', action='store_true', help='Skip terminated instances, deleted volumes and incomplete snapshots')
+    parser.add_argument('--async', dest='use_async', action='store_true', help='Discover resources with aioboto3 on a single event loop')
+    parser.add_argument('--live-pricing', action='store_true', help='Fetch region-specific rates from the AWS Pricing API')
+    parser.add_argument('--cache-ttl', type=int, default=0, help='Reuse per-region results cached within this many seconds (default: 0, no cache)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached results and refresh them')
     parser.add_argument('--output', type=str, help='Output filename for the report')
     parser.add_argument('--format', type=str, choices=['txt', 'csv', 'json'], default='txt', help='Output format: txt, csv, or json (default: txt)')
     parser.add_argument('--quiet', action='store_true', help='Run in quiet mode with minimal output')
     parser.add_argument('--version', action='store_true', help='Show version')
+    return parser
 
-    args = parser.parse_args()
+
+def main():
+    """Main function to run the Cloud Resource Archaeologist."""
+    args = _build_parser().parse_args()
 
     if args.version:
         print(f"Cloud Archaeologist {VERSION}")
         return
 
-    # Set up AWS credentials/profile if specified
-    if args.profile:
-        boto3.setup_default_session(profile_name=args.profile)
-
     # Process services argument
-    services_to_scan = ['ec2', 'ebs', 's3', 'eip', 'snapshots']  # default to all
+    services_to_scan = ALL_SERVICES  # default to all
     if args.services:
-        services_to_scan = [s.strip().lower() for s in args.services.split(',')]
+        requested = tuple(s.strip().lower() for s in args.services.split(','))
         # Validate services
-        valid_services = {'ec2', 'ebs', 's3', 'eip', 'snapshots', 'all'}
-        if 'all' in services_to_scan:
-            services_to_scan = ['ec2', 'ebs', 's3', 'eip', 'snapshots']
+        if 'all' in requested:
+            services_to_scan = ALL_SERVICES
         else:
-            invalid_services = [s for s in services_to_scan if s not in valid_services]
+            invalid_services = set(requested) - VALID_SERVICES
             if invalid_services:
-                print(f"Error: Invalid services specified: {invalid_services}")
+                print(f"Error: Invalid services specified: {sorted(invalid_services)}")
                 sys.exit(1)
+            services_to_scan = requested
 
     # Process regions argument
     regions_to_scan = None  # None means all regions
@@ -811,34 +1366,43 @@ def main():
     skip_cost_calculations = args.no_cost
 
     # Create and run the archaeologist with regions to scan
-    archaeologist = CloudResourceArchaeologist(quiet=args.quiet, regions_to_scan=regions_to_scan)
+    archaeologist = CloudResourceArchaeologist(
+        quiet=args.quiet,
+        regions_to_scan=regions_to_scan,
+        live_pricing=args.live_pricing and not skip_cost_calculations,
+        skip_terminated=args.skip_terminated,
+        profile_name=args.profile,
+        cache_ttl=args.cache_ttl,
+        refresh_cache=args.no_cache,
+    )
 
     try:
         # Modify archaeologist behavior based on no-cost argument
         if skip_cost_calculations:
             # Temporarily modify cost constants to zero for cost calculation
             archaeologist.cost_constants = {
-                'ec2': {k: 0 for k in archaeologist.cost_constants['ec2']},
-                'ebs': {k: 0 for k in archaeologist.cost_constants['ebs']},
-                's3': {k: 0 for k in archaeologist.cost_constants['s3']},
-                'eip': {'hourly_rate': 0},
-                'snapshot': {'per_gb_month': 0}
+                service: dict.fromkeys(rates, 0) for service, rates in archaeologist.cost_constants.items()
             }
 
         # Run the full scan with all parameters
-        archaeologist.run_full_scan(
-            output_format=args.format,
-            services_to_scan=services_to_scan,
-            output_filename=args.output
-        )
+        if args.use_async:
+            asyncio.run(archaeologist.run_full_scan_async(
+                output_format=args.format,
+                services_to_scan=services_to_scan,
+                output_filename=args.output
+            ))
+        else:
+            archaeologist.run_full_scan(
+                output_format=args.format,
+                services_to_scan=services_to_scan,
+                output_filename=args.output
+            )
 
     except KeyboardInterrupt:
-        if not archaeologist.quiet:
-            archaeologist.print_red("\n[WARNING] Scan interrupted by user.")
+        archaeologist.print_red("\n[WARNING] Scan interrupted by user.")
         sys.exit(1)
     except Exception as e:
-        if not archaeologist.quiet:
-            archaeologist.print_red(f"[ERROR] Error during scan: {str(e)}")
+        archaeologist.print_red(f"[ERROR] Error during scan: {str(e)}")
         sys.exit(1)
 
 